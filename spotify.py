@@ -4,19 +4,30 @@ import sys
 import os
 import shutil
 import logging
+import logging.handlers
 import webbrowser
 import json
+import re
 import queue
+import atexit
+import weakref
+import hashlib
 import subprocess
 import platform
+import functools
+import ctypes
+from collections import OrderedDict
 from datetime import timedelta, datetime
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 
 # GUI Imports
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, simpledialog
-from PIL import Image, ImageTk
+from PIL import Image
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from rapidfuzz import fuzz, utils
 
 # Audio / API Imports
 import spotipy
@@ -29,43 +40,102 @@ from dotenv import load_dotenv
 # Secure Storage
 import keyring
 
+# Optional faster JSON (falls back to the stdlib json module)
+try: import orjson
+except ImportError: orjson = None
+
 # --- PATH CONFIGURATION ---
 APP_NAME = "SpotifyTidalSync"
 # Service name for Windows Credential Manager / Linux Keyring
 KEYRING_SERVICE = "SpotifyTidalSync"
+# Every entry this app stores under KEYRING_SERVICE
+KEYRING_KEYS = ("tidal_session", "spotify_token", "SPOTIFY_CLIENT_ID", "SPOTIFY_CLIENT_SECRET")
 
-APPDATA_DIR = os.path.join(os.environ['APPDATA'] if platform.system() == "Windows" else os.path.expanduser('~/.config'), APP_NAME)
+_SYS_OS = platform.system()
 
-if not os.path.exists(APPDATA_DIR):
-    os.makedirs(APPDATA_DIR)
+APPDATA_DIR = os.path.join(os.environ['APPDATA'] if _SYS_OS == "Windows" else os.path.expanduser('~/.config'), APP_NAME)
+os.makedirs(APPDATA_DIR, exist_ok=True)
 
 SETTINGS_FILE = os.path.join(APPDATA_DIR, "settings.json")
 MAPPINGS_FILE = os.path.join(APPDATA_DIR, "mappings.json")
+MAPPINGS_LOG = os.path.join(APPDATA_DIR, "mappings.jsonl")
 ENV_FILE = os.path.join(APPDATA_DIR, ".env")
 LOG_FILE = os.path.join(APPDATA_DIR, "debug.log")
+ART_DIR = os.path.join(APPDATA_DIR, "art") # Resized covers, one PNG per image URL
+# Written once the bundled .env is in place so later launches skip the check
+ENV_EXTRACTED_MARKER = os.path.join(APPDATA_DIR, ".env.extracted")
 
 # --- INITIALIZATION ---
 def extract_bundled_files():
-    if getattr(sys, 'frozen', False):
-        bundled_env = os.path.join(sys._MEIPASS, ".env")
-        if os.path.exists(bundled_env) and not os.path.exists(ENV_FILE):
-            try:
-                shutil.copy2(bundled_env, ENV_FILE)
-            except Exception: pass
+    if not getattr(sys, 'frozen', False) or os.path.exists(ENV_EXTRACTED_MARKER): return
+    bundled_env = os.path.join(sys._MEIPASS, ".env")
+    if os.path.exists(bundled_env) and not os.path.exists(ENV_FILE):
+        try:
+            shutil.copy2(bundled_env, ENV_FILE)
+        except Exception: return
+    if os.path.exists(ENV_FILE):
+        try: open(ENV_EXTRACTED_MARKER, 'w').close()
+        except OSError: pass
 
 extract_bundled_files()
 load_dotenv(ENV_FILE)
 
 REFRESH_RATE = 1.0 
+LOG_WATCHDOG_MS = 5000 # Fallback drain of the log view in case a wakeup was missed
+LOG_WATCHDOG_MAX_MS = 30000 # Watchdog interval ceiling while nothing is being logged
+LOG_VIEW_MAX_LINES = 2000
+# How long a tick waits on a Spotify poll before leaving it for the next tick
+PLAYBACK_TIMEOUT = 0.8
+ART_CACHE_SIZE = 32
+ART_DISK_CACHE_FILES = 500
+ART_SIZE = (300, 300)
+PHOTO_CACHE_SIZE = 16 # PhotoImages kept by the main window
+TRACK_CACHE_SIZE = 128
+DEVICE_CACHE_TTL = 60
+MATCH_THRESHOLD = 75 # Minimum score (0-100) for an automatic search match
 
 # --- CLEAN LOGGING SETUP ---
-log_queue = queue.Queue()
+# Bounded so a stalled GUI can't let it grow forever; the oldest lines are dropped first
+log_queue = queue.Queue(maxsize=4096)
 
 class QueueHandler(logging.Handler):
+    """Feeds log_queue and wakes the attached Settings window when lines arrive."""
+    def __init__(self):
+        super().__init__()
+        self._window = None # weakref to the SettingsWindow showing the logs
+        self.wake_pending = False # A <<LogReady>> event is already on its way
+
+    def attach(self, window):
+        self._window = weakref.ref(window)
+        self.wake_pending = False
+
+    def detach(self, window=None):
+        """Stops waking `window` (or whichever window is attached when None)."""
+        current = self._window() if self._window else None
+        if window is None or current is window: self._window = None
+
+    def handle(self, record):
+        # Wake the window outside the handler lock; the Tk call waits on the main thread
+        emitted = super().handle(record)
+        if emitted: self._wake()
+        return emitted
+
+    def _wake(self):
+        window = self._window() if self._window else None
+        if window is None or self.wake_pending: return
+        self.wake_pending = True
+        try: window.event_generate("<<LogReady>>", when="tail")
+        except Exception: self.wake_pending = False # Window closed or mainloop gone
+
     def emit(self, record):
         try:
             msg = self.format(record)
-            log_queue.put(msg)
+            try: log_queue.put_nowait(msg)
+            except queue.Full:
+                try:
+                    log_queue.get_nowait()
+                    log_queue.put_nowait(msg)
+                except (queue.Empty, queue.Full): pass
         except Exception:
             self.handleError(record)
 
@@ -75,16 +145,40 @@ logging.getLogger("urllib3").setLevel(logging.WARNING)
 logging.getLogger("spotipy").setLevel(logging.WARNING)
 logging.getLogger("tidalapi").setLevel(logging.WARNING)
 
-logging.basicConfig(
-    level=logging.INFO, 
-    format='%(asctime)s | %(message)s',
-    datefmt='%H:%M:%S',
-    handlers=[
-        logging.StreamHandler(sys.stdout), 
-        QueueHandler(),
-        logging.FileHandler(LOG_FILE, mode='w')
-    ]
-)
+# Callers only enqueue records; a listener thread does the actual output.
+# File writes are buffered and forced out early by warnings/errors.
+_log_format = logging.Formatter('%(asctime)s | %(message)s', datefmt='%H:%M:%S')
+_file_handler = logging.FileHandler(LOG_FILE, mode='w')
+_file_handler.setFormatter(_log_format)
+_buffered_file_handler = logging.handlers.MemoryHandler(64, flushLevel=logging.WARNING, target=_file_handler)
+gui_log_handler = QueueHandler()
+# GUI last: its wakeup waits on the Tk main thread, so stdout and the file must not queue behind it
+_output_handlers = [logging.StreamHandler(sys.stdout), _buffered_file_handler, gui_log_handler]
+for _handler in _output_handlers: _handler.setFormatter(_log_format)
+
+_log_listener = logging.handlers.QueueListener(queue.SimpleQueue(), *_output_handlers)
+_record_handler = logging.handlers.QueueHandler(_log_listener.queue)
+_record_handler.setFormatter(logging.Formatter('%(message)s')) # Timestamp is added by the output handlers
+
+logging.basicConfig(level=logging.INFO, handlers=[_record_handler])
+_log_listener.start()
+
+LOG_STOP_TIMEOUT = 2.0
+_log_stopped = False
+def _stop_logging():
+    """Drains the listener queue and writes out buffered file lines (safe to call from the Tk thread)."""
+    global _log_stopped
+    if _log_stopped: return
+    _log_stopped = True
+    # The listener may be blocked on a Tk wakeup; never join it from here without a bound
+    gui_log_handler.detach()
+    stopper = threading.Thread(target=_log_listener.stop, name="LogStop", daemon=True)
+    stopper.start()
+    stopper.join(LOG_STOP_TIMEOUT)
+    _buffered_file_handler.flush() # Write out what arrived even if the listener is still stuck
+
+atexit.register(_stop_logging) # Backstop only; the app exits through os._exit, so shutdown calls it too
+
 logger = logging.getLogger("SyncApp")
 logger.setLevel(logging.DEBUG)
 
@@ -115,6 +209,26 @@ def get_credentials():
         
     return client_id, client_secret
 
+def wipe_keyring():
+    """Deletes every credential this app stored in the keyring."""
+    kr = keyring.get_keyring() # Resolve the backend once for all deletes
+    # Secret Service opens a DBus connection per call; find and delete all our items over one
+    if hasattr(kr, "get_preferred_collection"):
+        try:
+            collection = kr.get_preferred_collection() # Same collection keyring wrote to (unlocked)
+            try:
+                for item in collection.search_items({"service": KEYRING_SERVICE}): item.delete()
+                return
+            finally:
+                collection.connection.close()
+        except Exception as e:
+            logger.warning(f"Bulk keyring wipe failed, deleting one by one: {e}")
+
+    for key in KEYRING_KEYS:
+        # Any backend error (not stored, DBus/secretstorage failure) must not stop the file wipe
+        try: kr.delete_password(KEYRING_SERVICE, key)
+        except Exception: pass
+
 # Run Migration on Startup
 migrate_credentials_to_keyring()
 SPOTIFY_CLIENT_ID, SPOTIFY_CLIENT_SECRET = get_credentials()
@@ -123,34 +237,138 @@ SPOTIFY_REDIRECT_URI = os.getenv('SPOTIFY_REDIRECT_URI', 'http://127.0.0.1:8888/
 # --- DATA PERSISTENCE ---
 def load_json(filepath):
     try:
-        if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                return json.load(f)
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson else json.loads(raw)
+    except FileNotFoundError: pass
     except Exception as e:
         logger.error(f"Load error {filepath}: {e}")
     return {}
 
 def save_json(filepath, data):
     try:
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=4)
+        # Encode the whole document up front so it goes out in a single write()
+        if orjson: buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else: buf = json.dumps(data, indent=2).encode('utf-8')
+        with open(filepath, 'wb') as f:
+            f.write(buf)
+        return True
     except Exception as e:
         logger.error(f"Save error {filepath}: {e}")
+        return False
+
+# --- DEBOUNCED WRITES ---
+# Several saves in quick succession (e.g. toggle clicks) are
+# coalesced into a single rewrite of the file once things settle down.
+FLUSH_DELAY = 0.5
+_pending_writes = {} # filepath -> (timer, data)
+_pending_lock = threading.Lock()
+
+def _schedule_flush(filepath, data):
+    with _pending_lock:
+        pending = _pending_writes.get(filepath)
+        if pending: pending[0].cancel()
+        timer = threading.Timer(FLUSH_DELAY, _flush, args=(filepath,))
+        timer.daemon = True
+        _pending_writes[filepath] = (timer, data)
+        timer.start()
+
+def _flush(filepath):
+    with _pending_lock:
+        pending = _pending_writes.pop(filepath, None)
+    if pending: save_json(filepath, dict(pending[1]))
+
+def flush_pending_writes():
+    """Writes out anything still waiting on its debounce timer."""
+    with _pending_lock:
+        pending = list(_pending_writes.items())
+        _pending_writes.clear()
+    for filepath, (timer, data) in pending:
+        timer.cancel()
+        save_json(filepath, dict(data))
+
+def discard_pending_writes():
+    """Drops queued writes without saving them (used before wiping data)."""
+    with _pending_lock:
+        for timer, _ in _pending_writes.values(): timer.cancel()
+        _pending_writes.clear()
+
+atexit.register(flush_pending_writes)
 
 # Mappings: Spotify ID -> Tidal ID
-def load_mappings(): return load_json(MAPPINGS_FILE)
-def save_mapping(sp_id, tidal_id):
-    data = load_mappings()
-    data[sp_id] = tidal_id
-    save_json(MAPPINGS_FILE, data)
-    logger.info(f"Mapping saved: {sp_id} -> {tidal_id}")
+# mappings.json is a compacted snapshot. New mappings are appended to
+# mappings.jsonl one line at a time and replayed on top of it when loading;
+# the log is folded back into the snapshot once it outgrows the data.
+COMPACT_INTERVAL = 300
+_mappings_cache = None
+_mappings_log_lines = 0
+_mappings_lock = threading.Lock()
+
+def load_mappings():
+    global _mappings_cache, _mappings_log_lines
+    if _mappings_cache is None:
+        data = load_json(MAPPINGS_FILE)
+        lines = 0
+        try:
+            with open(MAPPINGS_LOG, 'r') as f:
+                for line in f:
+                    try: entry = json.loads(line)
+                    except ValueError: continue # Torn line from an interrupted write
+                    data[entry['sp']] = entry['td']
+                    lines += 1
+        except FileNotFoundError: pass
+        except Exception as e:
+            logger.error(f"Load error {MAPPINGS_LOG}: {e}")
+        _mappings_cache, _mappings_log_lines = data, lines
+    return _mappings_cache
+
+def append_mapping(sp_id, tidal_id):
+    global _mappings_log_lines
+    line = json.dumps({'sp': sp_id, 'td': tidal_id}) + "\n"
+    with _mappings_lock:
+        try:
+            with open(MAPPINGS_LOG, 'a') as f:
+                f.write(line)
+            _mappings_log_lines += 1
+        except Exception as e:
+            logger.error(f"Save error {MAPPINGS_LOG}: {e}")
+
+def compact_mappings():
+    """Folds the log into the snapshot once it has over twice as many lines as there are mappings."""
+    global _mappings_log_lines
+    with _mappings_lock:
+        data = load_mappings()
+        if _mappings_log_lines <= 2 * len(data): return
+        # Replace the snapshot atomically so an interrupted compaction can't lose mappings
+        tmp_file = MAPPINGS_FILE + ".tmp"
+        if not save_json(tmp_file, dict(data)): return
+        try:
+            os.replace(tmp_file, MAPPINGS_FILE)
+            open(MAPPINGS_LOG, 'w').close()
+            _mappings_log_lines = 0
+            logger.debug(f"Compacted mappings ({len(data)} entries)")
+        except Exception as e:
+            logger.error(f"Mapping compaction failed: {e}")
+
+def start_mapping_compactor():
+    def _run():
+        compact_mappings()
+        start_mapping_compactor()
+    timer = threading.Timer(COMPACT_INTERVAL, _run)
+    timer.daemon = True
+    timer.start()
 
 # Settings
-def load_settings(): return load_json(SETTINGS_FILE)
+_settings_cache = None
+def load_settings():
+    global _settings_cache
+    if _settings_cache is None: _settings_cache = load_json(SETTINGS_FILE)
+    return _settings_cache
 def save_setting(key, value):
     data = load_settings()
+    if key in data and data[key] == value: return
     data[key] = value
-    save_json(SETTINGS_FILE, data)
+    _schedule_flush(SETTINGS_FILE, data)
 
 # --- SECURE TOKEN STORAGE ---
 class KeyringCacheHandler(CacheHandler):
@@ -158,34 +376,51 @@ class KeyringCacheHandler(CacheHandler):
     Custom CacheHandler for Spotipy to store tokens in OS Keyring/Credential Manager
     instead of a plaintext file.
     """
+    # Spotipy asks for the token before every API call; keep it in memory
+    # for a while instead of going through the OS credential service each time.
+    CACHE_TTL = 30
+
     def __init__(self, username_key="spotify_token"):
         self.username_key = username_key
+        self._cached = None
+        self._cached_at = 0
+        self._last_written = None # Token JSON currently in the keyring, if known
 
     def get_cached_token(self):
+        if self._cached is not None and time.monotonic() - self._cached_at < self.CACHE_TTL:
+            return self._cached
         try:
             token_string = keyring.get_password(KEYRING_SERVICE, self.username_key)
             if token_string:
-                return json.loads(token_string)
+                self._last_written = token_string
+                self._cached = json.loads(token_string)
+                self._cached_at = time.monotonic()
+                return self._cached
         except Exception as e:
             logger.warning(f"Keyring read error (Spotify): {e}")
         return None
 
     def save_token_to_cache(self, token_info):
+        self._cached = token_info
+        self._cached_at = time.monotonic()
+        token_string = json.dumps(token_info)
+        if token_string == self._last_written: return # Nothing new to store
         try:
-            keyring.set_password(KEYRING_SERVICE, self.username_key, json.dumps(token_info))
+            keyring.set_password(KEYRING_SERVICE, self.username_key, token_string)
+            self._last_written = token_string
         except Exception as e:
             logger.error(f"Keyring write error (Spotify): {e}")
 
+# Quality fallback order (best first), resolved once against this tidalapi version
+QUALITY_LADDER = tuple(
+    (name, getattr(tidalapi.Quality, name))
+    for name in ('hi_res_lossless', 'high_lossless', 'lossless', 'high', 'low')
+    if hasattr(tidalapi, 'Quality') and hasattr(tidalapi.Quality, name)
+)
+
 def get_tidal_quality():
-    try:
-        if not hasattr(tidalapi, 'Quality'): return None
-        Q = tidalapi.Quality
-        # Prefer High Res
-        options = ['hi_res_lossless', 'high_lossless', 'lossless', 'LOSSLESS', 'high', 'HIGH']
-        for opt in options:
-            if hasattr(Q, opt): return getattr(Q, opt)
-        return None
-    except: return None
+    # Prefer High Res
+    return QUALITY_LADDER[0][1] if QUALITY_LADDER else None
 
 PREFERRED_QUALITY = get_tidal_quality()
 
@@ -193,18 +428,41 @@ PREFERRED_QUALITY = get_tidal_quality()
 class AudioPlayer:
     def __init__(self):
         # VLC Instance
-        self.instance = vlc.Instance('--no-video', '--verbose=-1', '--aout=directsound' if platform.system() == "Windows" else '', '--network-caching=1500') 
+        self.instance = vlc.Instance('--no-video', '--verbose=-1', '--aout=directsound' if _SYS_OS == "Windows" else '', '--network-caching=1500') 
         self.player = self.instance.media_player_new()
         try: self.player.audio_set_volume(100)
         except: pass 
         
+        # Output devices rarely change, keep the last enumeration around
+        self._devices_cache = None
+        self._devices_cache_at = 0
+        # VLC reports device changes through an event; use it to drop the cache and wake waiters
+        self._devices_changed = threading.Event()
+        device_event = getattr(vlc.EventType, 'MediaPlayerAudioDevice', None)
+        if device_event is not None:
+            try: self.player.event_manager().event_attach(device_event, self._on_audio_device)
+            except Exception as e: logger.debug(f"Audio device events unavailable: {e}")
+
+        # Deferred setup, run on the sync thread once control_loop starts
+        self._pending_startup = []
         settings = load_settings()
         saved_device = settings.get("last_device_id")
         if saved_device:
-            threading.Timer(1.0, lambda: self.set_device(saved_device)).start()
+            self._pending_startup.append(lambda: self.set_device(saved_device))
+
+    def _on_audio_device(self, event):
+        # Runs on a VLC thread, keep it minimal
+        self._devices_cache = None
+        self._devices_changed.set()
+
+    def run_pending_startup(self):
+        while self._pending_startup:
+            self._pending_startup.pop(0)()
 
     def get_audio_devices(self):
         # This can be slow, call asynchronously where possible
+        if self._devices_cache is not None and time.monotonic() - self._devices_cache_at < DEVICE_CACHE_TTL:
+            return self._devices_cache
         devices = []
         try:
             mods = self.player.audio_output_device_enum()
@@ -219,6 +477,26 @@ class AudioPlayer:
                 vlc.libvlc_audio_output_device_list_release(mods)
         except Exception as e:
             logger.error(f"Error listing audio devices: {e}")
+        if devices: # Don't cache an empty list from a VLC that isn't ready yet
+            self._devices_cache = devices
+            self._devices_cache_at = time.monotonic()
+        return devices
+
+    def refresh_devices(self):
+        self._devices_cache = None
+        return self.get_audio_devices()
+
+    def wait_for_devices(self, timeout=2.0):
+        """Returns the device list as soon as VLC reports one, waiting on device events in between."""
+        deadline = time.monotonic() + timeout
+        devices = self.get_audio_devices()
+        delay = 0.01
+        while not devices and time.monotonic() < deadline:
+            # A device event from VLC cuts the wait short
+            self._devices_changed.clear()
+            self._devices_changed.wait(delay)
+            delay = min(delay * 2, 0.2)
+            devices = self.get_audio_devices()
         return devices
 
     def set_device(self, device_id):
@@ -257,9 +535,32 @@ class SyncManager:
         
         settings = load_settings()
         self.mute_spotify = settings.get("mute_spotify", True)
+        self._spotify_muted = False # We sent volume(0) and haven't seen it undone
+        self._loud_ticks = 0 # Consecutive polls reporting a non-zero Spotify volume
+        self._mute_device_id = None
+        self._mute_failed = False # Current device refused volume(0) with a 403
+        self._tidal_session_json = None # Last session JSON read from / written to the keyring
         self.auto_favorite = settings.get("auto_favorite", False)
         self.current_song_favorited = False
         self.waiting_for_user_selection = False
+        self.mappings = load_mappings()
+        start_mapping_compactor()
+        self._track_cache = OrderedDict() # tidal_id -> tidalapi Track, oldest first
+
+        # Network calls run here so a slow request doesn't stall the control loop
+        self.pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="SyncIO")
+        self._playback_future = None
+        self._art_future = None # (url, future) of the cover being prefetched
+        self._last_state_key = None # (track id, is_playing, progress seconds) seen last tick
+
+        # One keep-alive session for cover downloads, shared with the GUI
+        self.http = requests.Session()
+        self.http.headers.update({'User-Agent': APP_NAME})
+        # Covers all come from one CDN host: keep a few pooled connections and retry blips
+        self.http.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                                max_retries=Retry(total=2, backoff_factor=0.2)))
+        self._art_cache = OrderedDict() # url -> decoded PIL image, oldest first
+        self._art_lock = threading.Lock()
 
     def login(self):
         # Spotify
@@ -290,6 +591,7 @@ class SyncManager:
             loaded = False
             try:
                 session_json = keyring.get_password(KEYRING_SERVICE, "tidal_session")
+                self._tidal_session_json = session_json
                 if session_json:
                     data = json.loads(session_json)
                     
@@ -329,38 +631,58 @@ class SyncManager:
                 
                  # --- SAVE SESSION IF SUCCESSFUL TO KEYRING ---
                  if self.tidal.check_login():
-                     expiry_ts = None
-                     if self.tidal.expiry_time:
-                         # tidalapi might store expiry as datetime object
-                         expiry_ts = self.tidal.expiry_time.timestamp()
-                     
-                     session_data = {
-                         'token_type': self.tidal.token_type,
-                         'access_token': self.tidal.access_token,
-                         'refresh_token': self.tidal.refresh_token,
-                         'expiry_time': expiry_ts
-                     }
-                     try:
-                         keyring.set_password(KEYRING_SERVICE, "tidal_session", json.dumps(session_data))
-                         logger.info("Tidal: Session Cached to Keyring")
-                     except Exception as e:
-                         logger.error(f"Failed to save Tidal session to Keyring: {e}")
+                     self.save_tidal_session()
 
+            # Persist tokens tidalapi may have refreshed while loading the cache (no-op if unchanged)
+            if loaded: self.save_tidal_session()
             return True
         except Exception as e:
             logger.error(f"Tidal Login Failed: {e}")
             return False
 
+    def save_tidal_session(self):
+        expiry_ts = None
+        if self.tidal.expiry_time:
+            # tidalapi might store expiry as datetime object
+            expiry_ts = self.tidal.expiry_time.timestamp()
+        
+        session_data = {
+            'token_type': self.tidal.token_type,
+            'access_token': self.tidal.access_token,
+            'refresh_token': self.tidal.refresh_token,
+            'expiry_time': expiry_ts
+        }
+        session_json = json.dumps(session_data)
+        if session_json == self._tidal_session_json: return # Already stored
+        try:
+            keyring.set_password(KEYRING_SERVICE, "tidal_session", session_json)
+            self._tidal_session_json = session_json
+            logger.info("Tidal: Session Cached to Keyring")
+        except Exception as e:
+            logger.error(f"Failed to save Tidal session to Keyring: {e}")
+
+    def save_mapping(self, sp_id, tidal_id):
+        self.mappings[sp_id] = tidal_id
+        append_mapping(sp_id, tidal_id)
+        logger.info(f"Mapping saved: {sp_id} -> {tidal_id}")
+
     def get_tidal_track_by_id(self, tidal_id):
-        try: return self.tidal.track(tidal_id)
-        except: return None
+        track = self._track_cache.pop(tidal_id, None)
+        if track is None:
+            try: track = self.tidal.track(tidal_id)
+            except: return None
+        self._track_cache[tidal_id] = track
+        if len(self._track_cache) > TRACK_CACHE_SIZE: self._track_cache.popitem(last=False)
+        return track
+
+    # Track name up to the first "(" or "-" (drops "(Remastered)", "- Live" etc.)
+    _CLEAN_RE = re.compile(r'^[^(\-]+')
 
     def search_tidal_match(self, sp_track):
         # 1. Check Mappings
-        mappings = load_mappings()
         sp_id = sp_track['id']
-        if sp_id in mappings:
-            t_track = self.get_tidal_track_by_id(mappings[sp_id])
+        if sp_id in self.mappings:
+            t_track = self.get_tidal_track_by_id(self.mappings[sp_id])
             if t_track:
                 logger.info(f"Found manual mapping for '{sp_track['name']}'")
                 return t_track
@@ -371,18 +693,24 @@ class SyncManager:
         duration_ms = sp_track['duration_ms']
         
         try:
-            clean_name = track_name.split('(')[0].split('-')[0].strip()
-            query = f"{clean_name} {artist_name}"
+            match = self._CLEAN_RE.match(track_name)
+            query = f"{match.group(0).strip() if match else ''} {artist_name}"
             logger.info(f"Searching Tidal: '{query}'")
             search = self.tidal.search(query, models=[tidalapi.media.Track], limit=10)
             
-            best_match = None
-            for t in search['tracks']:
-                if abs((t.duration * 1000) - duration_ms) <= 5000:
-                    best_match = t
-                    break
-            
-            if best_match: return best_match
+            # Score every result within 5s on title/artist similarity and duration
+            def score(t):
+                t_artist = t.artist.name if t.artist else ""
+                delta = abs((t.duration * 1000) - duration_ms)
+                # rapidfuzz 3 compares raw strings; fold case/punctuation so "HUMBLE." matches "Humble"
+                return (0.6 * fuzz.token_set_ratio(track_name, t.name, processor=utils.default_process)
+                        + 0.3 * fuzz.token_set_ratio(artist_name, t_artist, processor=utils.default_process)
+                        + 0.1 * max(0, 100 - delta / 100))
+
+            candidates = [t for t in search['tracks'] if abs((t.duration * 1000) - duration_ms) <= 5000]
+            if candidates:
+                best_score, best_match = max(((score(t), t) for t in candidates), key=lambda pair: pair[0])
+                if best_score >= MATCH_THRESHOLD: return best_match
             
             logger.warning(f"No exact match found for '{track_name}'. Waiting for user.")
             return None
@@ -408,21 +736,10 @@ class SyncManager:
              return False
 
         # --- CORRECT QUALITY FALLBACK LOGIC ---
-        Q = tidalapi.Quality
-        qualities_to_try = []
-        try:
-            possible_attrs = ['hi_res_lossless', 'high_lossless', 'lossless', 'high', 'low']
-            for attr in possible_attrs:
-                if hasattr(Q, attr):
-                    qualities_to_try.append(getattr(Q, attr))
-        except: pass
-
-        if not qualities_to_try: qualities_to_try = [PREFERRED_QUALITY]
-        
         url = None
         used_quality = "Unknown"
         
-        for quality in qualities_to_try:
+        for name, quality in QUALITY_LADDER:
             try:
                 # Set Session Quality
                 self.tidal.config.quality = quality
@@ -431,7 +748,7 @@ class SyncManager:
                 url = tidal_track.get_url()
                 
                 if url:
-                    used_quality = str(quality).split(".")[-1].upper()
+                    used_quality = name.upper()
                     break
             except Exception as e:
                 logger.warning(f"Quality {quality} failed for this track: {e}")
@@ -439,6 +756,8 @@ class SyncManager:
 
         if not url:
             logger.error(f"FATAL: Could not stream '{tidal_track.name}' (Tried all qualities).")
+            # Might be a stale (e.g. region-locked) cached entry, look it up again next time
+            self._track_cache.pop(tidal_track.id, None)
             self.player.stop()
             return False
 
@@ -457,8 +776,42 @@ class SyncManager:
             self.player.stop()
             return False
 
+    def _fire_and_forget(self, fn, *args, on_error=None):
+        """Sends a Spotify command from the pool without waiting for the reply."""
+        def _report(future):
+            if future.cancelled(): return # Dropped by pool.shutdown(cancel_futures=True)
+            if future.exception():
+                logger.warning(f"Spotify command failed: {future.exception()}")
+                if on_error: on_error(future.exception())
+        self.pool.submit(fn, *args).add_done_callback(_report)
+
+    def _download_art(self, url):
+        with self._art_lock:
+            img = self._art_cache.get(url)
+            if img is not None:
+                self._art_cache.move_to_end(url)
+                return img
+        # Let PIL read straight from the response instead of buffering .content first
+        with self.http.get(url, stream=True, timeout=5) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            img = Image.open(response.raw)
+            img.load()
+        with self._art_lock:
+            self._art_cache[url] = img
+            if len(self._art_cache) > ART_CACHE_SIZE: self._art_cache.popitem(last=False)
+        return img
+
+    def get_art(self, url):
+        """Returns the decoded cover image, reusing the download sync_logic started for it."""
+        pending = self._art_future
+        if pending and pending[0] == url:
+            return pending[1].result(timeout=5)
+        return self._download_art(url)
+
     def shutdown(self):
         self.running = False
+        flush_pending_writes()
         try:
             # Force pause on Spotify
             if self.sp:
@@ -472,9 +825,16 @@ class SyncManager:
         except: 
             pass
 
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        _stop_logging() # Exits skip atexit, write the buffered log lines out now
+
     def sync_logic(self):
-        try: sp_playback = self.sp.current_playback()
-        except: self.status = "Spotify Error"; return
+        if self._playback_future is None:
+            self._playback_future = self.pool.submit(self.sp.current_playback)
+        try: sp_playback = self._playback_future.result(timeout=PLAYBACK_TIMEOUT)
+        except FutureTimeout: return # Still in flight, pick it up next tick
+        except: self._playback_future = None; self.status = "Spotify Error"; return
+        self._playback_future = None
 
         if not sp_playback or not sp_playback.get('item'):
             self.status = "Spotify Idle"
@@ -483,16 +843,43 @@ class SyncManager:
         sp_track = sp_playback['item']
         sp_id = sp_track['id']
         sp_is_playing = sp_playback['is_playing']
+
+        # Fast path: Spotify looks the same as last tick, only keep VLC's pause state in line
+        prev_key = self._last_state_key
+        self._last_state_key = (sp_id, sp_is_playing, (sp_playback.get('progress_ms') or 0) // 1000)
+        if (self._last_state_key == prev_key and not self.is_paused_waiting
+                and self.current_spotify_track and sp_id == self.current_spotify_track['id']):
+            if self.current_tidal_track and not self.waiting_for_user_selection:
+                self._sync_pause_state(sp_is_playing)
+            return
         
         # Mute Spotify Logic
         if self.mute_spotify:
             try: 
-                if sp_playback.get('device', {}).get('volume_percent') != 0: self.sp.volume(0)
+                device = sp_playback.get('device') or {}
+                if device.get('id') != self._mute_device_id:
+                    self._mute_device_id = device.get('id')
+                    self._spotify_muted = False
+                    self._mute_failed = False
+                volume = device.get('volume_percent')
+                if volume == 0: self._loud_ticks = 0
+                elif volume is not None: self._loud_ticks += 1
+                # Some devices refuse volume control (403 VOLUME_CONTROL_DISALLOW), don't keep asking
+                can_mute = device.get('supports_volume') is not False and not self._mute_failed
+                # Once muted, a stale report right after the command isn't enough to resend it
+                if can_mute and self._loud_ticks >= (2 if self._spotify_muted else 1):
+                    self._fire_and_forget(self.sp.volume, 0, on_error=self._on_mute_failed)
+                    self._spotify_muted = True
+                    self._loud_ticks = 0
             except: pass
 
-        # Get Art
-        try: self.current_image_url = sp_track['album']['images'][0]['url']
-        except: self.current_image_url = None
+        # Get Art (stable per track; prefetched so the GUI finds it ready)
+        if prev_key is None or prev_key[0] != sp_id:
+            try: image_url = self._pick_cover_url(sp_track['album']['images'])
+            except: image_url = None
+            if image_url != self.current_image_url:
+                self.current_image_url = image_url
+                if image_url: self._art_future = (image_url, self.pool.submit(self._download_art, image_url))
 
         # --- Track Change ---
         if self.current_spotify_track is None or sp_id != self.current_spotify_track['id']:
@@ -523,14 +910,17 @@ class SyncManager:
 
         # --- Playback Monitor ---
         if self.current_tidal_track and not self.waiting_for_user_selection:
-            # Simple Pause/Resume Sync
-            if not sp_is_playing and self.player.is_playing(): self.player.pause()
-            elif sp_is_playing and not self.player.is_playing() and not self.is_paused_waiting:
-                if self.player.get_time() < self.player.get_duration() - 500: self.player.resume()
+            # Read each position once per tick (VLC calls go through ctypes)
+            t_time = self.player.get_time()
+            t_dur = self.player.get_duration()
+            sp_dur = sp_track['duration_ms']
+            sp_prog = sp_playback['progress_ms']
+
+            self._sync_pause_state(sp_is_playing, t_time, t_dur)
 
             # Auto Favorite
             if self.auto_favorite and not self.current_song_favorited and self.player.is_playing():
-                if (self.player.get_time() / self.player.get_duration()) >= 0.90:
+                if t_dur > 0 and (t_time / t_dur) >= 0.90:
                     try:
                         self.tidal.add_favorite(self.current_tidal_track.id)
                         self.current_song_favorited = True
@@ -538,22 +928,60 @@ class SyncManager:
                     except: pass
             
             # End of Track Handling
-            time_left_tidal = self.player.get_duration() - self.player.get_time()
-            time_left_sp = sp_track['duration_ms'] - sp_playback['progress_ms']
+            time_left_tidal = t_dur - t_time
+            time_left_sp = sp_dur - sp_prog
             
             # If Spotify is way ahead (next song buffered), pause it
             if time_left_sp < 3000 and time_left_tidal > 5000 and not self.is_paused_waiting:
-                self.sp.pause_playback()
+                self._fire_and_forget(self.sp.pause_playback)
                 self.is_paused_waiting = True
                 logger.info("Buffering: Pausing Spotify to let Tidal finish")
 
             # If Tidal finishes, force Spotify Next
             if self.is_paused_waiting and (time_left_tidal < 1000 or not self.player.is_playing()):
-                self.sp.next_track()
+                self._fire_and_forget(self.sp.next_track)
                 self.is_paused_waiting = False
 
+    @staticmethod
+    def _pick_cover_url(images):
+        # Smallest cover that is still at least as wide as we display it (Spotify lists 640/300/64)
+        fitting = [img for img in images if (img.get('width') or 0) >= ART_SIZE[0]]
+        return min(fitting, key=lambda img: img['width'])['url'] if fitting else images[0]['url']
+
+    def set_mute_spotify(self, enabled):
+        self.mute_spotify = enabled
+        self._spotify_muted = False
+        self._mute_failed = False
+
+    def _on_mute_failed(self, error):
+        # Pool thread. Only a 403 (VOLUME_CONTROL_DISALLOW) means the device refuses volume control;
+        # that latches until the active device changes. Anything else is retried on the next loud tick.
+        if isinstance(error, spotipy.SpotifyException) and error.http_status == 403: self._mute_failed = True
+        else: self._spotify_muted = False
+
+    def _sync_pause_state(self, sp_is_playing, t_time=None, t_dur=None):
+        # Simple Pause/Resume Sync
+        if not sp_is_playing and self.player.is_playing(): self.player.pause()
+        elif sp_is_playing and not self.player.is_playing() and not self.is_paused_waiting:
+            if t_time is None: t_time, t_dur = self.player.get_time(), self.player.get_duration()
+            if t_time < t_dur - 500: self.player.resume()
+
+    def _lower_thread_priority(self):
+        # Let the Tk main loop win when the sync thread competes with it for CPU
+        try:
+            if _SYS_OS == "Windows":
+                THREAD_PRIORITY_BELOW_NORMAL = -1
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_BELOW_NORMAL)
+            elif _SYS_OS == "Linux":
+                os.nice(5) # Per-thread on Linux; threads started from here inherit it
+        except Exception as e:
+            logger.debug(f"Could not lower sync thread priority: {e}")
+
     def control_loop(self):
+        self._lower_thread_priority()
         if not self.login(): return
+        self.player.run_pending_startup()
         self.status = "Running"
         while self.running:
             try:
@@ -576,7 +1004,7 @@ class SyncManager:
     # Commands
     def manual_map_track(self, tidal_track):
         if self.current_spotify_track:
-            save_mapping(self.current_spotify_track['id'], tidal_track.id)
+            self.save_mapping(self.current_spotify_track['id'], tidal_track.id)
             self.current_tidal_track = tidal_track
             self.waiting_for_user_selection = False
             self.status = f"Mapped: {tidal_track.name}"
@@ -602,6 +1030,40 @@ class SyncManager:
 
 # --- GUI CLASSES ---
 
+# Flat dark buttons: (style, background, hover background, overrides)
+BUTTON_STYLES = (
+    ("Dark.TButton", "#282828", "#404040", {}),
+    ("Secondary.TButton", "#444444", "#555555", {"font": ("Segoe UI", 9)}),
+    ("Tool.TButton", "#333333", "#444444", {}),
+    ("Accent.TButton", "#008800", "#00a000", {"font": ("Segoe UI", 9, "bold"), "padding": (15, 5)}),
+    ("Danger.TButton", "#880000", "#a00000", {}),
+    ("Warning.TButton", "#552222", "#663333", {"foreground": "#ffbbbb", "font": ("Segoe UI", 9)}),
+    ("Muted.TButton", "#1a1a1a", "#262626", {"foreground": "#888888"}),
+)
+
+def configure_button_styles(style):
+    """Registers the button styles once so each widget only carries a style name."""
+    for name, bg, active_bg, overrides in BUTTON_STYLES:
+        options = {"foreground": "white", "font": ("Segoe UI", 10), "padding": (10, 5), "relief": "flat",
+                   "borderwidth": 0, "bordercolor": bg, "lightcolor": bg, "darkcolor": bg, "focuscolor": bg}
+        options.update(overrides)
+        style.configure(name, background=bg, **options)
+        style.map(name, background=[('active', active_bg)], foreground=[('active', options["foreground"])])
+
+DarkButton = functools.partial(ttk.Button, style="Dark.TButton")
+SecondaryButton = functools.partial(ttk.Button, style="Secondary.TButton")
+ToolButton = functools.partial(ttk.Button, style="Tool.TButton")
+AccentButton = functools.partial(ttk.Button, style="Accent.TButton")
+DangerButton = functools.partial(ttk.Button, style="Danger.TButton")
+WarningButton = functools.partial(ttk.Button, style="Warning.TButton")
+MutedButton = functools.partial(ttk.Button, style="Muted.TButton")
+
+# Standard Linux mixer, looked up once instead of scanning PATH on every click
+_MIXER_CMD = None
+if _SYS_OS == "Linux":
+    if shutil.which("pavucontrol"): _MIXER_CMD = ["pavucontrol"]
+    elif shutil.which("gnome-control-center"): _MIXER_CMD = ["gnome-control-center", "sound"]
+
 class ModernToplevel(tk.Toplevel):
     """Base class for styled windows"""
     def __init__(self, parent, title, geometry):
@@ -647,8 +1109,7 @@ class ManualSelectWindow(ModernToplevel):
         self.entry_search.insert(0, f"{sp_track['name']} {sp_track['artists'][0]['name']}")
         
         # Modern Flat Search Button
-        tk.Button(search_frame, text="Search Tidal", command=self.do_search, 
-                  bg="#444444", fg="white", relief="flat", padx=10, pady=2).pack(side='left')
+        SecondaryButton(search_frame, text="Search Tidal", command=self.do_search, padding=(10, 2)).pack(side='left')
 
         # Results List
         self.tree = ttk.Treeview(self, columns=("Title", "Artist", "Album"), show='headings', height=10)
@@ -667,11 +1128,9 @@ class ManualSelectWindow(ModernToplevel):
         btn_frame.pack(fill='x', padx=20, pady=20)
         
         # Modern Flat Action Buttons
-        tk.Button(btn_frame, text="Select & Map This Track", command=self.select_track,
-                  bg="#008800", fg="white", relief="flat", padx=15, pady=5, font=("Segoe UI", 9, "bold")).pack(side='right')
+        AccentButton(btn_frame, text="Select & Map This Track", command=self.select_track).pack(side='right')
                   
-        tk.Button(btn_frame, text="Cancel", command=self.destroy,
-                  bg="#444444", fg="white", relief="flat", padx=10, pady=5, font=("Segoe UI", 9)).pack(side='right', padx=10)
+        SecondaryButton(btn_frame, text="Cancel", command=self.destroy).pack(side='right', padx=10)
 
         self.found_tracks = []
         self.do_search() # Auto search on open
@@ -736,10 +1195,15 @@ class SettingsWindow(ModernToplevel):
         # Audio Device
         tk.Label(frame, text="Audio Output Device:", bg="#1e1e1e", fg="white", font=("Segoe UI", 10)).pack(anchor='w', padx=20, pady=(20,5))
         
-        self.combo_device = ttk.Combobox(frame, state="readonly", width=60)
-        self.combo_device.pack(anchor='w', padx=20, pady=(0, 20))
+        device_row = tk.Frame(frame, bg="#1e1e1e")
+        device_row.pack(anchor='w', padx=20, pady=(0, 20))
+
+        self.combo_device = ttk.Combobox(device_row, state="readonly", width=60)
+        self.combo_device.pack(side='left')
         self.combo_device.set("Loading devices...")
         self.combo_device.bind("<<ComboboxSelected>>", self.on_device)
+
+        ToolButton(device_row, text="Refresh", command=self.refresh_devices, padding=(10, 1)).pack(side='left', padx=(10, 0))
         
         # Async load devices
         threading.Thread(target=self.load_devices, daemon=True).start()
@@ -759,27 +1223,36 @@ class SettingsWindow(ModernToplevel):
 
         # Mixer Button
         mixer_text = "Open Volume Mixer"
-        if platform.system() == "Linux": mixer_text = "Open Linux Audio Control"
+        if _SYS_OS == "Linux": mixer_text = "Open Linux Audio Control"
         
-        tk.Button(frame, text=mixer_text, command=self.open_mixer,
-                  bg="#333333", fg="white", relief="flat", padx=10, pady=5).pack(anchor='w', padx=20, pady=20)
+        ToolButton(frame, text=mixer_text, command=self.open_mixer).pack(anchor='w', padx=20, pady=20)
         
         # Danger Zone
         tk.Label(frame, text="Reset Data", bg="#1e1e1e", fg="#ff5555", font=("Segoe UI", 10, "bold")).pack(anchor='w', padx=20, pady=(20,5))
-        tk.Button(frame, text="Factory Reset (Wipe All Data)", command=self.wipe_data,
-                  bg="#880000", fg="white", relief="flat", padx=10, pady=5).pack(anchor='w', padx=20)
+        DangerButton(frame, text="Factory Reset (Wipe All Data)", command=self.wipe_data).pack(anchor='w', padx=20)
 
     def build_logs(self, frame):
         self.log_text = scrolledtext.ScrolledText(frame, bg="#101010", fg="#00ff00", font=("Consolas", 9), state='disabled')
         self.log_text.pack(fill='both', expand=True, padx=5, pady=5)
+        self.bind("<<LogReady>>", self.update_logs)
+        self.bind("<Destroy>", self._on_destroy)
+        gui_log_handler.attach(self)
+        self._logs_arrived = False # Lines were drained since the last watchdog run
+        self._log_quiet_cycles = 0
         self.update_logs()
+        self.after(LOG_WATCHDOG_MS, self._log_watchdog)
 
-    def load_devices(self):
+    def refresh_devices(self):
+        self.combo_device.set("Loading devices...")
+        threading.Thread(target=self.load_devices, args=(True,), daemon=True).start()
+
+    def load_devices(self, refresh=False):
         self.dev_map = {}
         try:
-            # Add delay to ensure VLC is ready
-            time.sleep(1) 
-            devs = self.manager.player.get_audio_devices()
+            if refresh:
+                devs = self.manager.player.refresh_devices()
+            else:
+                devs = self.manager.player.wait_for_devices()
             names = []
             if devs:
                 for name, did in devs:
@@ -802,61 +1275,84 @@ class SettingsWindow(ModernToplevel):
 
     def open_mixer(self):
         # Open in thread/process to avoid freezing
-        sys_os = platform.system()
         try:
-            if sys_os == "Windows":
-                subprocess.Popen(["start", "ms-settings:apps-volume"], shell=True)
-            elif sys_os == "Linux":
-                # Try standard linux mixers
-                cmd = None
-                if shutil.which("pavucontrol"): cmd = ["pavucontrol"]
-                elif shutil.which("gnome-control-center"): cmd = ["gnome-control-center", "sound"]
-                
-                if cmd: subprocess.Popen(cmd)
+            if _SYS_OS == "Windows" and hasattr(os, "startfile"):
+                os.startfile("ms-settings:apps-volume") # ShellExecute, no cmd.exe in between
+            elif _SYS_OS == "Linux":
+                # Detach so the mixer doesn't inherit Tk's fds or our session
+                if _MIXER_CMD: subprocess.Popen(_MIXER_CMD, close_fds=True, start_new_session=True)
                 else: messagebox.showinfo("Linux Audio", "Could not find 'pavucontrol' or gnome-settings.")
         except Exception as e:
             logger.error(f"Error opening mixer: {e}")
 
     def save_toggles(self):
-        self.manager.mute_spotify = self.mute_var.get()
+        self.manager.set_mute_spotify(self.mute_var.get())
         self.manager.auto_favorite = self.fav_var.get()
         save_setting("mute_spotify", self.manager.mute_spotify)
         save_setting("auto_favorite", self.manager.auto_favorite)
 
     def wipe_data(self):
         if messagebox.askyesno("Reset", "Delete all settings and login data? App will close."):
+            # Close the UI right away; the cleanup below finishes out of sight
+            try:
+                self.withdraw()
+                self.master.withdraw()
+                self.master.update_idletasks()
+            except: pass
+            # Stop everything that could still write under APPDATA_DIR before it's moved aside
+            # (no waiting here: a running art worker may itself be waiting on this thread via after())
+            self.manager.running = False
+            self.master._art_pool.shutdown(wait=False, cancel_futures=True)
+            self.manager.pool.shutdown(wait=False, cancel_futures=True)
+            _stop_logging()
             logging.shutdown()
+            discard_pending_writes()
             try:
-                # Wipe Credentials from Keyring
-                try: keyring.delete_password(KEYRING_SERVICE, "tidal_session")
-                except: pass
-                try: keyring.delete_password(KEYRING_SERVICE, "spotify_token")
-                except: pass
-                # Wipe Migrated Credentials
-                try: keyring.delete_password(KEYRING_SERVICE, "SPOTIFY_CLIENT_ID")
-                except: pass
-                try: keyring.delete_password(KEYRING_SERVICE, "SPOTIFY_CLIENT_SECRET")
-                except: pass
+                # Wipe Credentials (incl. migrated client id/secret) from Keyring
+                wipe_keyring()
                 
-                # Wipe Files
-                shutil.rmtree(APPDATA_DIR, ignore_errors=True)
+                # Wipe Files: move the folder aside first so a relaunch starts clean immediately
+                wipe_dir = APPDATA_DIR + ".wipe"
+                with self.master._art_write_lock: # An art worker mid-write finishes before the move
+                    try: os.rename(APPDATA_DIR, wipe_dir)
+                    except OSError: wipe_dir = APPDATA_DIR
+                shutil.rmtree(wipe_dir, ignore_errors=True)
             except: pass
             os._exit(0)
 
-    def update_logs(self):
+    def update_logs(self, event=None):
         if not self.winfo_exists(): return
+        gui_log_handler.wake_pending = False
         try:
             lines = []
-            while not log_queue.empty():
-                lines.append(log_queue.get_nowait())
+            try:
+                while True: lines.append(log_queue.get_nowait())
+            except queue.Empty: pass
             
             if lines:
+                self._logs_arrived = True
                 self.log_text.config(state='normal')
                 self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+                # Trim from the top so the widget doesn't grow for the whole session
+                line_count = int(self.log_text.index('end-1c').split('.')[0])
+                if line_count > LOG_VIEW_MAX_LINES:
+                    self.log_text.delete('1.0', f'{line_count - LOG_VIEW_MAX_LINES}.0')
                 self.log_text.see(tk.END)
                 self.log_text.config(state='disabled')
         except: pass
-        self.after(500, self.update_logs)
+
+    def _on_destroy(self, event):
+        # The weakref can outlive the window until GC; stop the listener calling into a dead widget
+        if event.widget is self: gui_log_handler.detach(self)
+
+    def _log_watchdog(self):
+        if not self.winfo_exists(): return
+        self.update_logs()
+        # Back off while the log is quiet; new lines still arrive through <<LogReady>>
+        self._log_quiet_cycles = 0 if self._logs_arrived else self._log_quiet_cycles + 1
+        self._logs_arrived = False
+        delay = min(LOG_WATCHDOG_MAX_MS, LOG_WATCHDOG_MS * (1 + self._log_quiet_cycles // 4))
+        self.after(delay, self._log_watchdog)
 
 class MainApp(tk.Tk):
     def __init__(self, manager):
@@ -866,13 +1362,22 @@ class MainApp(tk.Tk):
         self.geometry("400x700")
         self.configure(bg="#121212")
         self.last_img = None
+        self._last_track = self._last_status = self._last_time = None # Texts currently shown
         self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Album art: PhotoImages in memory, resized PNGs on disk, downloads on a worker pool
+        self._art_mem = OrderedDict() # url -> PhotoImage, oldest first
+        self._art_inflight = set() # URLs currently queued or downloading
+        self._art_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="Art")
+        self._art_write_lock = threading.Lock() # Held while writing under ART_DIR (wipe_data takes it too)
+        self._art_pool.submit(self._prune_art_dir)
         
         # Styles
         style = ttk.Style()
         style.theme_use('clam')
         style.configure("Main.TLabel", background="#121212", foreground="white", font=("Segoe UI", 10))
         style.configure("Status.TLabel", background="#121212", foreground="#888888", font=("Segoe UI", 9))
+        configure_button_styles(style)
         
         # UI - UPDATED LABEL (No fixed size to allow image to dictate size)
         self.lbl_art = tk.Label(self, bg="#121212", text="[No Art]", fg="#444444")
@@ -887,24 +1392,21 @@ class MainApp(tk.Tk):
         
         self.lbl_time = ttk.Label(self, text="0:00", style="Main.TLabel")
         self.lbl_time.pack(pady=5)
+        self._time_w = str(self.lbl_time) # Tcl path, updated directly every tick in _update
 
         # Controls
         ctrl_frame = tk.Frame(self, bg="#121212")
         ctrl_frame.pack(pady=20)
         
-        btn_style = {"bg": "#282828", "fg": "white", "relief": "flat", "font": ("Segoe UI", 10), "activebackground": "#404040", "activeforeground": "white"}
-        
-        tk.Button(ctrl_frame, text="<<", command=manager.prev_track, width=5, **btn_style).pack(side='left', padx=5)
-        tk.Button(ctrl_frame, text="Play/Pause", command=manager.toggle_play, width=10, **btn_style).pack(side='left', padx=5)
-        tk.Button(ctrl_frame, text=">>", command=manager.next_track, width=5, **btn_style).pack(side='left', padx=5)
+        DarkButton(ctrl_frame, text="<<", command=manager.prev_track, width=5).pack(side='left', padx=5)
+        DarkButton(ctrl_frame, text="Play/Pause", command=manager.toggle_play, width=10).pack(side='left', padx=5)
+        DarkButton(ctrl_frame, text=">>", command=manager.next_track, width=5).pack(side='left', padx=5)
 
         # Fix Match Button
-        tk.Button(self, text="⚠ Report Wrong Song / Fix Match", command=self.open_manual_match, 
-                  bg="#552222", fg="#ffbbbb", relief="flat", font=("Segoe UI", 9)).pack(pady=20)
+        WarningButton(self, text="⚠ Report Wrong Song / Fix Match", command=self.open_manual_match).pack(pady=20)
 
         # Settings
-        tk.Button(self, text="Settings", command=self.open_settings, 
-                  bg="#1a1a1a", fg="#888888", relief="flat").pack(side='bottom', pady=20, fill='x')
+        MutedButton(self, text="Settings", command=self.open_settings).pack(side='bottom', pady=20, fill='x')
 
     def open_manual_match(self, sp_track=None):
         track_to_fix = sp_track if sp_track else self.manager.current_spotify_track
@@ -920,24 +1422,91 @@ class MainApp(tk.Tk):
         self.after(0, lambda: self._update(info))
 
     def _update(self, info):
-        self.lbl_track.config(text=info['tidal_track'])
-        self.lbl_status.config(text=info['status'])
-        self.lbl_time.config(text=info['vlc_time'])
+        # Only touch labels whose text changed (each config is a Tcl round-trip)
+        if info['tidal_track'] != self._last_track:
+            self._last_track = info['tidal_track']
+            self.lbl_track.config(text=self._last_track)
+        if info['status'] != self._last_status:
+            self._last_status = info['status']
+            self.lbl_status.config(text=self._last_status)
+        if info['vlc_time'] != self._last_time:
+            self._last_time = info['vlc_time']
+            self.tk.call(self._time_w, 'configure', '-text', self._last_time)
         
         url = info.get('image_url')
         if url != self.last_img:
             self.last_img = url
-            if url:
-                try:
-                    data = requests.get(url).content
-                    img = Image.open(BytesIO(data))
-                    # UPDATED RESIZE for better quality & size
-                    img = img.resize((300, 300), Image.Resampling.LANCZOS)
-                    self.photo = ImageTk.PhotoImage(img)
-                    self.lbl_art.config(image=self.photo, width=300, height=300) 
-                except: pass
+            if url: self._show_art(url)
+
+    def _show_art(self, url):
+        # Revisited cover (e.g. shuffle flipping back): no hashing, disk, network or PIL work
+        photo = self._art_mem.get(url)
+        if photo is not None:
+            self._art_mem.move_to_end(url)
+            self._set_art(photo)
+            return
+        key = hashlib.sha1(url.encode()).hexdigest()
+        if os.path.exists(self._art_path(key)):
+            self._install_art(url, key)
+        elif url not in self._art_inflight:
+            self._art_inflight.add(url)
+            self._art_pool.submit(self._fetch_art, url, key)
+
+    def _art_path(self, key):
+        return os.path.join(ART_DIR, f"{key}.png")
+
+    def _fetch_art(self, url, key):
+        # Worker thread: download, resize and store the cover, then hand back to the main loop
+        try:
+            # Skipped past this track while the job was queued, leave it for a later visit
+            if url != self.last_img: return
+            img = self.manager.get_art(url)
+            if img.size != ART_SIZE:
+                # thumbnail() works in place, so work on a copy of the shared cached image
+                img = img.copy()
+                img.thumbnail(ART_SIZE, Image.Resampling.BILINEAR)
+            if img.mode not in ("RGB", "RGBA"): img = img.convert("RGB")
+            with self._art_write_lock:
+                if not self.manager.running: return # Shutting down or wiping, don't recreate ART_DIR
+                os.makedirs(ART_DIR, exist_ok=True)
+                tmp_path = self._art_path(key) + ".tmp"
+                img.save(tmp_path, "PNG", optimize=True)
+                os.replace(tmp_path, self._art_path(key))
+        except Exception as e:
+            logger.warning(f"Album art download failed: {e}")
+            return
+        finally:
+            self._art_inflight.discard(url)
+        self.after(0, lambda: self._install_art(url, key))
+
+    def _install_art(self, url, key):
+        try:
+            path = self._art_path(key)
+            photo = tk.PhotoImage(master=self, file=path) # Tk decodes the cached PNG natively
+            os.utime(path) # Keeps the disk cache in least-recently-used order
+        except Exception as e:
+            logger.warning(f"Album art load failed: {e}")
+            return
+        self._art_mem[url] = photo
+        if len(self._art_mem) > PHOTO_CACHE_SIZE: self._art_mem.popitem(last=False)
+        if url == self.last_img: self._set_art(photo)
+
+    def _set_art(self, photo):
+        self.photo = photo
+        self.lbl_art.config(image=self.photo, width=300, height=300) 
+
+    def _prune_art_dir(self):
+        # Drop the least recently shown covers once the disk cache grows past its limit
+        try:
+            entries = sorted(os.scandir(ART_DIR), key=lambda e: e.stat().st_mtime)
+            for entry in entries[:-ART_DISK_CACHE_FILES]:
+                os.remove(entry.path)
+        except FileNotFoundError: pass
+        except Exception as e:
+            logger.warning(f"Album art cache cleanup failed: {e}")
 
     def on_close(self):
+        self._art_pool.shutdown(wait=False, cancel_futures=True)
         self.manager.shutdown()
         self.destroy()
         try:
@@ -953,7 +1522,7 @@ if __name__ == "__main__":
     manager.gui_callback = app.update_ui
     manager.request_manual_match_callback = app.open_manual_match
     
-    t = threading.Thread(target=manager.control_loop, daemon=True)
+    t = threading.Thread(target=manager.control_loop, name="SyncControl", daemon=True)
     t.start()
     
     app.mainloop()
\ No newline at end of file